@@ -20,6 +20,11 @@ import time
 import math
 
 
+# WCAG luminance coefficients in OpenCV's BGR channel order, pre-scaled
+# by 1/255 so 8-bit pixel values map straight to 0-1 luminance
+_COEFFS = np.array([0.0722, 0.7152, 0.2126], dtype=np.float32) / np.float32(255.0)
+
+
 def generate_foveated_samples(width, height, max_samples, fovea_size=0.4):
     """
     Generate foveated sample positions (high density center, lower density periphery).
@@ -34,7 +39,6 @@ def generate_foveated_samples(width, height, max_samples, fovea_size=0.4):
     Returns:
         numpy array: Array of (x, y) sample positions
     """
-    samples = []
     center_x = width / 2.0
     center_y = height / 2.0
     
@@ -48,47 +52,76 @@ def generate_foveated_samples(width, height, max_samples, fovea_size=0.4):
     min_radius = min(fovea_radius_x, fovea_radius_y)
     
     # Generate fovea samples (uniform distribution within circle)
-    for i in range(fovea_samples):
-        angle = np.random.random() * 2.0 * math.pi
-        radius = math.sqrt(np.random.random()) * min_radius
-        
-        x = center_x + math.cos(angle) * radius
-        y = center_y + math.sin(angle) * radius
-        
-        # Clamp to valid range
-        x = max(0, min(width - 1, x))
-        y = max(0, min(height - 1, y))
-        
-        samples.append([int(x), int(y)])
+    angles = np.random.random(fovea_samples) * 2.0 * math.pi
+    radii = np.sqrt(np.random.random(fovea_samples)) * min_radius
+    
+    # Clamp to valid range
+    xs = np.clip(center_x + np.cos(angles) * radii, 0, width - 1)
+    ys = np.clip(center_y + np.sin(angles) * radii, 0, height - 1)
+    
+    fovea_points = np.stack([xs, ys], axis=1).astype(np.int32)
     
     # Periphery region (sparse, uniform distribution outside fovea)
-    for i in range(periphery_samples):
-        attempts = 0
-        while attempts < 20:
-            x = np.random.random() * width
-            y = np.random.random() * height
-            
-            # Check if outside fovea
-            dx = (x - center_x) / fovea_radius_x
-            dy = (y - center_y) / fovea_radius_y
-            dist_sq = dx * dx + dy * dy
-            
-            if dist_sq >= 1.0:  # Outside fovea circle
-                samples.append([int(x), int(y)])
-                break
-            
-            attempts += 1
+    # Rejection-sample in bulk: draw candidates for all remaining samples
+    # at once and keep the ones that fall outside the fovea
+    periphery_xs = [np.empty(0)]
+    periphery_ys = [np.empty(0)]
+    remaining = periphery_samples
+    attempts = 0
+    while remaining > 0 and attempts < 20:
+        candidates = max(4 * remaining, 64)
+        x = np.random.random(candidates) * width
+        y = np.random.random(candidates) * height
+        
+        # Check if outside fovea
+        dx = (x - center_x) / fovea_radius_x
+        dy = (y - center_y) / fovea_radius_y
+        outside = (dx * dx + dy * dy) >= 1.0  # Outside fovea circle
         
-        # If couldn't find point outside fovea, place it at edge
-        if attempts >= 20:
-            angle = np.random.random() * 2.0 * math.pi
-            x = center_x + math.cos(angle) * (min_radius * 1.2)
-            y = center_y + math.sin(angle) * (min_radius * 1.2)
-            x = max(0, min(width - 1, x))
-            y = max(0, min(height - 1, y))
-            samples.append([int(x), int(y)])
+        x = x[outside][:remaining]
+        y = y[outside][:remaining]
+        periphery_xs.append(x)
+        periphery_ys.append(y)
+        remaining -= len(x)
+        attempts += 1
+    
+    # If couldn't find enough points outside fovea, place the rest at edge
+    if remaining > 0:
+        angles = np.random.random(remaining) * 2.0 * math.pi
+        periphery_xs.append(np.clip(center_x + np.cos(angles) * (min_radius * 1.2), 0, width - 1))
+        periphery_ys.append(np.clip(center_y + np.sin(angles) * (min_radius * 1.2), 0, height - 1))
     
-    return np.array(samples, dtype=np.int32)
+    periphery_points = np.stack(
+        [np.concatenate(periphery_xs), np.concatenate(periphery_ys)], axis=1
+    ).astype(np.int32)
+    
+    return np.concatenate([fovea_points, periphery_points])
+
+
+# Sample positions keyed by (width, height, max_samples, fovea_size)
+_sample_cache = {}
+
+
+def get_foveated_samples(width, height, max_samples, fovea_size=0.4):
+    """
+    Get foveated sample positions, generating them only once per resolution and settings.
+    
+    Args:
+        width: Image width
+        height: Image height
+        max_samples: Maximum number of samples
+        fovea_size: Size of fovea region (0-1, where 1 = full image)
+        
+    Returns:
+        numpy array: Read-only array of (x, y) sample positions
+    """
+    key = (width, height, max_samples, fovea_size)
+    samples = _sample_cache.get(key)
+    if samples is None:
+        samples = generate_foveated_samples(width, height, max_samples, fovea_size)
+        samples.setflags(write=False)
+        _sample_cache[key] = samples
+    return samples
 
 
 def calculate_brightness_from_frame(frame, max_samples=100, fovea_size=0.4, cached_samples=None):
@@ -108,38 +141,28 @@ def calculate_brightness_from_frame(frame, max_samples=100, fovea_size=0.4, cach
     
     # Generate or reuse cached sample positions
     if cached_samples is None or len(cached_samples) == 0:
-        sample_positions = generate_foveated_samples(width, height, max_samples, fovea_size)
+        sample_positions = get_foveated_samples(width, height, max_samples, fovea_size)
     else:
         sample_positions = cached_samples
     
-    # Convert BGR to RGB (OpenCV uses BGR by default)
-    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    
-    # Normalize RGB values to 0-1 range
-    rgb_normalized = frame_rgb.astype(np.float32) / 255.0
-    
-    # Sample pixels at foveated positions
-    total_brightness = 0.0
     sample_count = len(sample_positions)
+    if sample_count == 0:
+        return 0.0, sample_positions
     
-    for x, y in sample_positions:
-        # Ensure coordinates are within bounds
-        x = max(0, min(width - 1, x))
-        y = max(0, min(height - 1, y))
-        
-        # Get RGB values at sample position
-        r = rgb_normalized[y, x, 0]
-        g = rgb_normalized[y, x, 1]
-        b = rgb_normalized[y, x, 2]
-        
-        # Apply WCAG Relative Luminance formula
-        # L = 0.2126 * R + 0.7152 * G + 0.0722 * B
-        pixel_brightness = 0.2126 * r + 0.7152 * g + 0.0722 * b
-        
-        total_brightness += pixel_brightness
+    # Ensure coordinates are within bounds
+    xs = np.clip(sample_positions[:, 0], 0, width - 1)
+    ys = np.clip(sample_positions[:, 1], 0, height - 1)
+    
+    # Gather all sampled BGR pixels at once, reading the frame directly
+    # (no color conversion or float copy of the full frame is needed)
+    pixels = frame[ys, xs]
     
-    # Calculate average brightness
-    average_brightness = total_brightness / sample_count if sample_count > 0 else 0.0
+    # Luminance is linear, so the mean of per-pixel luminance equals
+    # the WCAG formula applied to the per-channel means:
+    # L = 0.2126 * mean(R) + 0.7152 * mean(G) + 0.0722 * mean(B)
+    # (normalization to 0-1 is folded into _COEFFS)
+    channel_sums = pixels.sum(axis=0, dtype=np.float64)
+    average_brightness = float(channel_sums @ _COEFFS) / sample_count
     
     return average_brightness, sample_positions
 
@@ -182,6 +205,29 @@ def process_video_realtime(video_path, show_video=True, show_overlay=True, perce
         frame = None
         brightness = 0.0
         cached_samples = None  # Cache sample positions for performance
+        display_buf = None  # Reused buffer for drawing the overlay
+        overlay_paused = False  # Whether the current overlay shows the pause indicator
+        last_progress_time = 0.0  # Console progress is throttled to ~10 updates per second
+        
+        def write_progress(brightness, frame_count, total_frames, percentage):
+            """Write the brightness progress line to the console."""
+            if percentage:
+                brightness_str = f"{brightness * 100:.2f}%"
+            else:
+                brightness_str = f"{brightness:.4f}"
+            sys.stdout.write(f"Frame {frame_count}/{total_frames}: Brightness = {brightness_str}\r")
+            sys.stdout.flush()
+        
+        # Use larger font size for better visibility
+        font_scale = 1.8
+        font_thickness = 4
+        
+        # Only the digits change between frames, so measure the widest text once
+        # and reuse its size for the background rectangle on every frame
+        text_template = "Brightness: 100.00%" if percentage else "Brightness: 0.0000"
+        (text_width, text_height), _ = cv2.getTextSize(
+            text_template, cv2.FONT_HERSHEY_SIMPLEX, font_scale, font_thickness
+        )
         
         def add_overlay(frame, brightness, frame_count, total_frames, percentage, is_paused):
             """Add brightness overlay to frame."""
@@ -190,14 +236,7 @@ def process_video_realtime(video_path, show_video=True, show_overlay=True, perce
             else:
                 text = f"Brightness: {brightness:.4f}"
             
-            # Use larger font size for better visibility
-            font_scale = 1.8
-            font_thickness = 4
-            
             # Add background rectangle for better visibility
-            (text_width, text_height), baseline = cv2.getTextSize(
-                text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, font_thickness
-            )
             cv2.rectangle(
                 frame, 
                 (15, 15), 
@@ -243,11 +282,15 @@ def process_video_realtime(video_path, show_video=True, show_overlay=True, perce
         
         while True:
             if not paused:
-                ret, frame = cap.read()
-                if not ret:
+                if not cap.grab():
                     # End of video or error
                     break
                 
+                # Decode into the previous frame's buffer instead of allocating a new one
+                ret, frame = cap.retrieve(frame)
+                if not ret:
+                    break
+                
                 frame_count += 1
                 
                 # Calculate brightness using foveated sampling
@@ -258,19 +301,23 @@ def process_video_realtime(video_path, show_video=True, show_overlay=True, perce
                     cached_samples=cached_samples
                 )
                 
-                # Display brightness in console
-                if percentage:
-                    brightness_str = f"{brightness * 100:.2f}%"
-                    print(f"Frame {frame_count}/{total_frames}: Brightness = {brightness_str}", end='\r')
-                else:
-                    print(f"Frame {frame_count}/{total_frames}: Brightness = {brightness:.4f}", end='\r')
+                # Display brightness in console (throttled, terminal I/O can dominate at high FPS)
+                now = time.time()
+                if now - last_progress_time >= 0.1:
+                    write_progress(brightness, frame_count, total_frames, percentage)
+                    last_progress_time = now
             
-            # Create a copy for overlay if needed
-            display_frame = frame.copy() if frame is not None else None
-            
-            # Overlay brightness on video frame
-            if display_frame is not None and show_video and show_overlay:
-                add_overlay(display_frame, brightness, frame_count, total_frames, percentage, paused)
+            # Draw the overlay into a reused buffer so the decoded frame stays clean.
+            # While paused the overlay only needs redrawing once, to add the indicator.
+            display_frame = frame
+            if frame is not None and show_video and show_overlay:
+                if display_buf is None or display_buf.shape != frame.shape:
+                    display_buf = np.empty_like(frame)
+                if not paused or not overlay_paused:
+                    np.copyto(display_buf, frame)
+                    add_overlay(display_buf, brightness, frame_count, total_frames, percentage, paused)
+                    overlay_paused = paused
+                display_frame = display_buf
             
             # Display video
             if show_video and display_frame is not None:
@@ -293,6 +340,10 @@ def process_video_realtime(video_path, show_video=True, show_overlay=True, perce
                 else:
                     time.sleep(0.1)
         
+        # Show the final frame's brightness, which throttling may have skipped
+        if frame_count > 0:
+            write_progress(brightness, frame_count, total_frames, percentage)
+        
         # Cleanup
         cap.release()
         if show_video:
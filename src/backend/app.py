@@ -7,7 +7,18 @@ import os
 app = Flask(__name__)
 CORS(app)
 
-model = joblib.load('migraine_regressor.pkl')
+# Resolve the model next to this file so the app also loads from another
+# working directory (e.g. gunicorn started from the repository root)
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migraine_regressor.pkl')
+model = joblib.load(MODEL_PATH)
+
+# The model is a random forest regressor. For a single-row request,
+# sklearn's predict spends most of its time dispatching the trees through
+# joblib, so evaluate the fitted trees directly and average them instead
+_trees = [estimator.tree_ for estimator in model.estimators_]
+
+def predict_risk(input_array):
+    return sum(tree.predict(input_array) for tree in _trees)[0, 0] / len(_trees)
 
 def prepare_input(data):
     # Extract input features from JSON and apply defaults as needed
@@ -34,7 +45,7 @@ def prepare_input(data):
         barometric_pressure, hour_of_day, heart_rate_variability,
         resting_heart_rate, sleep_quality_score, menstrual_cycle_day,
         light_exposure, posture_quality, gender_numeric
-    ]])
+    ]], dtype=np.float32)  # Trees evaluate in float32, so build the row in that dtype
     return input_array
 
 @app.route('/predict', methods=['POST'])
@@ -42,9 +53,21 @@ def predict():
     try:
         data = request.json
         input_array = prepare_input(data)
-        risk_percentage = model.predict(input_array)[0]
+        risk_percentage = predict_risk(input_array)
         risk_percentage = np.clip(risk_percentage, 0, 100)
 
+        # Read each field once; rules below keep their original defaults
+        age = data.get('age', 0)
+        is_female = data.get('gender', 'Male').lower() == 'female'
+        menstrual_cycle_day = data.get('menstrual_cycle_day', 15)
+        hormonal_phase = is_female and (menstrual_cycle_day <= 3 or menstrual_cycle_day >= 25)
+        sleep_hours = data.get('sleep_hours')
+        screen_time_hours = data.get('screen_time_hours', 0)
+        steps = data.get('steps', 0)
+        stress_level = data.get('stress_level', 0)
+        barometric_pressure = data.get('barometric_pressure', 1013)
+        hour_of_day = data.get('hour_of_day', 0)
+
         # Determine risk level
         if risk_percentage < 30:
             risk_level = "Low"
@@ -55,36 +78,36 @@ def predict():
 
         # Generate contributing factors
         factors = []
-        if data.get('gender', 'Male').lower() == 'female':
+        if is_female:
             factors.append("Female (higher baseline risk)")
-            if data.get('menstrual_cycle_day', 15) <= 3 or data.get('menstrual_cycle_day', 15) >= 25:
+            if hormonal_phase:
                 factors.append("Hormonal phase (menstrual/pre-menstrual)")
-        if 18 <= data.get('age', 0) <= 44:
+        if 18 <= age <= 44:
             factors.append("Peak migraine age group")
-        if data.get('sleep_hours', 0) < 6:
+        if sleep_hours is None or sleep_hours < 6:
             factors.append("Poor sleep quality")
-        if data.get('screen_time_hours', 0) > 7:
+        if screen_time_hours > 7:
             factors.append("Excessive screen time")
-        if data.get('steps', 0) < 3000:
+        if steps < 3000:
             factors.append("Low physical activity")
-        if data.get('stress_level', 0) > 7:
+        if stress_level > 7:
             factors.append("High stress levels")
-        if data.get('barometric_pressure', 1013) < 1000:
+        if barometric_pressure < 1000:
             factors.append("Dropping barometric pressure")
-        if 6 <= data.get('hour_of_day', 0) <= 10:
+        if 6 <= hour_of_day <= 10:
             factors.append("Morning hours (common attack time)")
 
         # Generate recommendations
         recommendations = []
-        if data.get('sleep_hours', 7) < 7:
+        if sleep_hours is not None and sleep_hours < 7:
             recommendations.append("Get 7-8 hours of sleep tonight")
-        if data.get('screen_time_hours', 0) > 6:
+        if screen_time_hours > 6:
             recommendations.append("Reduce screen time and take breaks")
-        if data.get('stress_level', 0) > 6:
+        if stress_level > 6:
             recommendations.append("Practice relaxation techniques")
         if risk_percentage > 60:
             recommendations.append("Consider preventive medication")
-        if data.get('gender', 'Male').lower() == 'female' and (data.get('menstrual_cycle_day', 15) <= 3 or data.get('menstrual_cycle_day', 15) >= 25):
+        if hormonal_phase:
             recommendations.append("Track hormonal triggers and consider hormonal management")
 
         confidence = "High" if 'heart_rate_variability' in data else "Medium"
@@ -104,6 +127,10 @@ def predict():
 def index():
     return "Migraine Prediction API Running"
 
+# The block below runs Flask's development server. In production, serve the
+# app with multiple gunicorn workers so predictions run in parallel:
+#   gunicorn -w $(nproc) -k gthread --threads 4 --preload -b 0.0.0.0:$PORT app:app
+# --preload loads the model once before forking, so workers share its memory.
 if __name__ == '__main__':
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port)
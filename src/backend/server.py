@@ -2,20 +2,75 @@
 """
 Brightness Analysis Backend Server
 Receives brightness data from Lens Studio and processes it with ML capabilities
+
+Development: python server.py (set FLASK_DEBUG=1 for the debugger and reloader)
+Production:  gunicorn --workers 1 --worker-class gthread --threads 8
+                      --worker-tmp-dir /dev/shm -b 0.0.0.0:5000 server:app
+
+History and statistics live in process memory, so serve with a single
+worker and scale with threads; separate worker processes would each
+keep their own history.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
+from werkzeug.exceptions import BadRequest
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+import fastjsonschema
 import json
+import math
 import numpy as np
-from typing import Dict, List, Optional
+import os
+import orjson
+import queue
+import sys
+from typing import Any, Dict, List, Optional, Union
 import threading
 import time
 
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider using orjson for request parsing and response serialization"""
+    
+    option = orjson.OPT_SERIALIZE_NUMPY
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_orjson_default, option=self.option).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Hand orjson's bytes to the response directly, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_orjson_default, option=self.option)
+        return self._app.response_class(body, mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for Lens Studio connections
 
+# Compress larger responses (mainly /api/brightness/history, whose entries
+# repeat the same keys); small per-frame responses are sent as-is
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
 # Data storage
 brightness_history: List[Dict] = []
 latest_brightness: float = 0.0
@@ -23,93 +78,346 @@ ml_model = None  # Placeholder for ML model
 
 # Configuration
 MAX_HISTORY_SIZE = 10000
+FRAME_MIN, FRAME_MAX = np.iinfo(np.int64).min, np.iinfo(np.int64).max
+BRIGHTNESS_SCALE = 65535  # Stored brightness is quantized to 16 bits
 ML_ENABLED = False  # Set to True when ML model is ready
+MAX_BATCH_SIZE = 64  # Maximum brightness posts analyzed together
+RESULT_TIMEOUT = 5.0  # Seconds a post waits for its analysis before failing
+
+# Compiled validator for POST /api/brightness bodies
+validate_brightness_post = fastjsonschema.compile({
+    'type': 'object',
+    'required': ['brightness'],
+    'properties': {
+        'brightness': {'type': 'number', 'minimum': 0.0, 'maximum': 1.0},
+        'timestamp': {'type': 'string'},
+        'frame': {'type': 'integer', 'minimum': FRAME_MIN, 'maximum': FRAME_MAX},  # Stored as int64
+        'device': {'type': 'string'}
+    }
+})
+
+# Brightness categories and the thresholds separating them
+CATEGORY_THRESHOLDS = (0.33, 0.67)
+CATEGORIES = ('dark', 'medium', 'bright')
+_CATEGORY_ARRAY = np.array(CATEGORIES)
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def now_iso() -> str:
+    """Current local time as ISO 8601, formatted at most once per second"""
+    return _format_timestamp(int(time.time()))
+
+
+@dataclass
+class BrightnessAnalysis:
+    """Analysis of a single brightness sample (serialized by orjson as a JSON object)"""
+    
+    # Declared by hand rather than with dataclass(slots=True), which needs
+    # Python 3.10; fields therefore take no defaults
+    __slots__ = ('brightness', 'category', 'timestamp', 'statistics', 'ml_predictions')
+    
+    brightness: float
+    category: str
+    timestamp: str
+    statistics: Optional[Dict]  # None when the client skipped statistics
+    ml_predictions: Optional[Dict]
 
 
 class BrightnessAnalyzer:
     """Analyzer for brightness data with ML capabilities"""
     
     def __init__(self):
-        self.history: List[Dict] = []
         self.ml_model = None
         
-    def add_brightness(self, brightness: float, metadata: Dict) -> Dict:
+        # History as parallel fixed-size ring buffers (one array per field)
+        # instead of a dict per sample; the slot at _head is overwritten
+        # next, evicting the oldest entry once the history is full
+        self._brightness = np.empty(MAX_HISTORY_SIZE, dtype=np.uint16)  # Quantized
+        self._frame = np.empty(MAX_HISTORY_SIZE, dtype=np.int64)
+        self._timestamp = np.empty(MAX_HISTORY_SIZE, dtype=object)
+        self._device = np.empty(MAX_HISTORY_SIZE, dtype=object)
+        self._head = 0
+        self._count = 0
+        
+        # Running statistics over the buffer, updated in O(1) per sample
+        self._seq = 0  # Samples added so far, used to expire min/max candidates
+        # Exact integer sums of the quantized values, so evictions cancel
+        # additions exactly and the variance never drifts
+        self._sum = 0
+        self._sum_sq = 0
+        self._min_candidates: deque = deque()  # (seq, value) with increasing values
+        self._max_candidates: deque = deque()  # (seq, value) with decreasing values
+        
+        # Statistics dict reused until a new sample arrives (keyed by self._seq)
+        self._stats_cache: Optional[Dict] = None
+        self._stats_cache_seq = -1
+        
+        # Analysis of the most recent sample, served by /api/brightness/latest
+        self.last_analysis: Optional[BrightnessAnalysis] = None
+        
+        # Guards history buffers and running statistics against concurrent
+        # readers. Held only for in-memory updates, never across I/O.
+        self._lock = threading.Lock()
+        
+    def add_brightness(self, brightness: float, metadata: Dict,
+                       include_stats: bool = True) -> BrightnessAnalysis:
         """
         Add brightness data point and return analysis
         
         Args:
             brightness: Brightness value (0.0 to 1.0)
             metadata: Additional metadata (timestamp, frame, device, etc.)
+            include_stats: Whether to include history statistics in the analysis
             
         Returns:
             Analysis results including ML predictions if available
         """
-        data_point = {
-            'brightness': brightness,
-            'timestamp': metadata.get('timestamp', datetime.now().isoformat()),
-            'frame': metadata.get('frame', 0),
-            'device': metadata.get('device', 'unknown')
-        }
-        
-        self.history.append(data_point)
-        
-        # Keep history size manageable
-        if len(self.history) > MAX_HISTORY_SIZE:
-            self.history.pop(0)
+        self._record(brightness, metadata)
         
         # Perform analysis
-        analysis = self.analyze_brightness(brightness, metadata)
+        analysis = self.analyze_brightness(brightness, metadata, include_stats=include_stats)
+        self.last_analysis = analysis
         
         return analysis
     
-    def analyze_brightness(self, brightness: float, metadata: Dict) -> Dict:
+    def add_brightness_batch(self, brightnesses: List[float], metadatas: List[Dict],
+                             include_stats: Optional[List[bool]] = None) -> List[BrightnessAnalysis]:
+        """
+        Add several brightness data points and return one analysis per point
+        
+        Statistics are computed once, after the whole batch is recorded,
+        and shared by all analyses in the batch that include them.
+        
+        Args:
+            brightnesses: Brightness values (0.0 to 1.0)
+            metadatas: Metadata for each brightness value
+            include_stats: Per point, whether to include statistics (all if omitted)
+            
+        Returns:
+            Analysis results in the same order as the input
+        """
+        self._record_many(brightnesses, metadatas)
+        
+        if include_stats is None:
+            include_stats = [True] * len(brightnesses)
+        
+        # Skip the statistics entirely when no point in the batch wants them
+        statistics = self._calculate_statistics() if any(include_stats) else None
+        categories = self._categorize_many(brightnesses)
+        
+        analyses = [
+            self.analyze_brightness(brightness, metadata, statistics, category, wants_stats)
+            for brightness, metadata, category, wants_stats
+            in zip(brightnesses, metadatas, categories, include_stats)
+        ]
+        if analyses:
+            self.last_analysis = analyses[-1]
+        
+        return analyses
+    
+    def _record(self, brightness: float, metadata: Dict):
+        """Store a brightness data point in the history and running statistics"""
+        timestamp = metadata['timestamp'] if 'timestamp' in metadata else now_iso()
+        frame = int(metadata.get('frame', 0))
+        # Only a handful of device names occur, so intern them and let every
+        # history slot share one string object per device
+        device = sys.intern(metadata.get('device', 'unknown'))
+        quantized = int(brightness * BRIGHTNESS_SCALE + 0.5)
+        
+        with self._lock:
+            i = self._head
+            if self._count == MAX_HISTORY_SIZE:
+                self._count -= 1
+                self._discard_from_statistics(self._brightness[i].item())
+            
+            self._brightness[i] = quantized
+            self._frame[i] = frame
+            self._timestamp[i] = timestamp
+            self._device[i] = device
+            
+            self._head = (i + 1) % MAX_HISTORY_SIZE
+            self._count += 1
+            self._add_to_statistics(quantized)
+    
+    def _record_many(self, brightnesses: List[float], metadatas: List[Dict]):
+        """
+        Store several brightness data points at once
+        
+        Equivalent to calling _record for each point, but writes each
+        buffer with one vectorized assignment, updates the running sums
+        once and takes the lock once for the whole batch.
+        """
+        if not brightnesses:
+            return
+        if len(brightnesses) > MAX_HISTORY_SIZE:
+            # Keep every write within one pass over the ring
+            for start in range(0, len(brightnesses), MAX_HISTORY_SIZE):
+                end = start + MAX_HISTORY_SIZE
+                self._record_many(brightnesses[start:end], metadatas[start:end])
+            return
+        
+        timestamps = [
+            metadata['timestamp'] if 'timestamp' in metadata else now_iso()
+            for metadata in metadatas
+        ]
+        frames = [int(metadata.get('frame', 0)) for metadata in metadatas]
+        devices = [sys.intern(metadata.get('device', 'unknown')) for metadata in metadatas]
+        # Same rounding as _record; truncation equals floor for non-negative values
+        quantized = (np.asarray(brightnesses, dtype=np.float64) * BRIGHTNESS_SCALE + 0.5).astype(np.uint16)
+        squares = quantized.astype(np.int64) ** 2
+        k = len(quantized)
+        
+        with self._lock:
+            slots = (self._head + np.arange(k)) % MAX_HISTORY_SIZE
+            
+            # Free slots come first after the head; any remaining writes
+            # overwrite (evict) the oldest entries
+            evicted = self._brightness[slots[MAX_HISTORY_SIZE - self._count:]]
+            evicted_squares = evicted.astype(np.int64) ** 2
+            self._sum += quantized.sum(dtype=np.int64).item() - evicted.sum(dtype=np.int64).item()
+            self._sum_sq += squares.sum().item() - evicted_squares.sum().item()
+            
+            self._brightness[slots] = quantized
+            self._frame[slots] = frames
+            self._timestamp[slots] = timestamps
+            self._device[slots] = devices
+            
+            self._head = (self._head + k) % MAX_HISTORY_SIZE
+            self._count = min(self._count + k, MAX_HISTORY_SIZE)
+            for value in quantized.tolist():
+                self._push_candidates(value)
+            self._expire_candidates()
+    
+    def analyze_brightness(self, brightness: float, metadata: Dict,
+                           statistics: Optional[Dict] = None,
+                           category: Optional[str] = None,
+                           include_stats: bool = True) -> BrightnessAnalysis:
         """
         Analyze brightness value and return insights
         
         Args:
             brightness: Current brightness value
             metadata: Additional metadata
+            statistics: Precomputed statistics (calculated from history if omitted)
+            category: Precomputed category (derived from brightness if omitted)
+            include_stats: Whether to include statistics (None in the result if not)
             
         Returns:
             Analysis results
         """
-        analysis = {
-            'brightness': brightness,
-            'category': self._categorize_brightness(brightness),
-            'timestamp': metadata.get('timestamp', datetime.now().isoformat()),
-            'statistics': self._calculate_statistics(),
-            'ml_predictions': None
-        }
+        if not include_stats:
+            statistics = None
+        elif statistics is None:
+            statistics = self._calculate_statistics()
+        if category is None:
+            category = self._categorize_brightness(brightness)
+        
+        analysis = BrightnessAnalysis(
+            brightness=brightness,
+            category=category,
+            timestamp=metadata['timestamp'] if 'timestamp' in metadata else now_iso(),
+            statistics=statistics,
+            ml_predictions=None
+        )
         
         # ML predictions (placeholder for future implementation)
         if ML_ENABLED and self.ml_model:
-            analysis['ml_predictions'] = self._ml_predict(brightness, metadata)
+            analysis.ml_predictions = self._ml_predict(brightness, metadata)
         
         return analysis
     
     def _categorize_brightness(self, brightness: float) -> str:
         """Categorize brightness into dark/medium/bright"""
-        if brightness < 0.33:
-            return "dark"
-        elif brightness < 0.67:
-            return "medium"
-        else:
-            return "bright"
+        low, high = CATEGORY_THRESHOLDS
+        return CATEGORIES[int(brightness >= low) + int(brightness >= high)]
+    
+    def _categorize_many(self, brightnesses: List[float]) -> List[str]:
+        """Categorize several brightness values at once"""
+        indices = np.digitize(brightnesses, CATEGORY_THRESHOLDS)
+        return _CATEGORY_ARRAY[indices].tolist()
+    
+    def _add_to_statistics(self, value: int):
+        """Fold a new quantized value into the running statistics (self._count already includes it)"""
+        self._sum += value
+        self._sum_sq += value * value
+        self._push_candidates(value)
+        self._expire_candidates()
+    
+    def _push_candidates(self, value: int):
+        """Append the newest value to the min/max candidate deques"""
+        self._seq += 1
+        while self._min_candidates and self._min_candidates[-1][1] >= value:
+            self._min_candidates.pop()
+        self._min_candidates.append((self._seq, value))
+        while self._max_candidates and self._max_candidates[-1][1] <= value:
+            self._max_candidates.pop()
+        self._max_candidates.append((self._seq, value))
+    
+    def _expire_candidates(self):
+        """Drop min/max candidates that have left the window"""
+        oldest = self._seq - self._count + 1
+        while self._min_candidates[0][0] < oldest:
+            self._min_candidates.popleft()
+        while self._max_candidates[0][0] < oldest:
+            self._max_candidates.popleft()
+    
+    def _discard_from_statistics(self, value: int):
+        """Remove an evicted quantized value from the running sums"""
+        self._sum -= value
+        self._sum_sq -= value * value
     
     def _calculate_statistics(self) -> Dict:
-        """Calculate statistics from history"""
-        if not self.history:
-            return {}
+        """
+        Calculate statistics from history
         
-        brightnesses = [item['brightness'] for item in self.history]
+        The result is cached until the next sample is added, so callers
+        must copy it before modifying it.
+        """
+        with self._lock:
+            if not self._count:
+                return {}
+            
+            if self._stats_cache_seq != self._seq:
+                n = self._count
+                # n^2 * variance, computed exactly in integers
+                scaled_variance = n * self._sum_sq - self._sum * self._sum
+                self._stats_cache = {
+                    'average': self._sum / (n * BRIGHTNESS_SCALE),
+                    'min': self._min_candidates[0][1] / BRIGHTNESS_SCALE,
+                    'max': self._max_candidates[0][1] / BRIGHTNESS_SCALE,
+                    'std': math.sqrt(scaled_variance) / (n * BRIGHTNESS_SCALE),
+                    'samples': n
+                }
+                self._stats_cache_seq = self._seq
+            
+            return self._stats_cache
+    
+    @property
+    def sample_count(self) -> int:
+        """Number of samples currently held in the history"""
+        return self._count
+    
+    def recent_history(self, limit: int) -> List[Dict]:
+        """Return up to `limit` of the newest history entries, oldest first"""
+        with self._lock:
+            n = min(max(limit, 0), self._count)
+            slots = (np.arange(self._head - n, self._head)) % MAX_HISTORY_SIZE
+            columns = (
+                (self._brightness[slots] / BRIGHTNESS_SCALE).tolist(),
+                self._timestamp[slots].tolist(),
+                self._frame[slots].tolist(),
+                self._device[slots].tolist()
+            )
         
-        return {
-            'average': float(np.mean(brightnesses)),
-            'min': float(np.min(brightnesses)),
-            'max': float(np.max(brightnesses)),
-            'std': float(np.std(brightnesses)),
-            'samples': len(brightnesses)
-        }
+        # Dicts are only built here, when the history is requested
+        return [
+            {'brightness': brightness, 'timestamp': timestamp, 'frame': frame, 'device': device}
+            for brightness, timestamp, frame, device in zip(*columns)
+        ]
     
     def _ml_predict(self, brightness: float, metadata: Dict) -> Optional[Dict]:
         """
@@ -139,8 +447,88 @@ class BrightnessAnalyzer:
         pass
 
 
+class _PendingSample:
+    """A brightness post waiting in the batch queue for its analysis"""
+    
+    __slots__ = ('brightness', 'metadata', 'include_stats', 'done', 'result', 'error')
+    
+    def __init__(self, brightness: float, metadata: Dict, include_stats: bool):
+        self.brightness = brightness
+        self.metadata = metadata
+        self.include_stats = include_stats
+        self.done = threading.Event()
+        self.result: Optional[BrightnessAnalysis] = None
+        self.error: Optional[Exception] = None
+
+
+class BrightnessBatcher:
+    """
+    Groups concurrent brightness posts so they are analyzed in batches
+    
+    A single worker thread takes the first queued post plus whatever
+    else is already queued (at most `max_batch_size`), then records and
+    analyzes the whole batch at once. It never waits for more posts, so
+    a lone post is analyzed immediately and batches only form from posts
+    that arrive while the worker is busy. Request threads block until
+    their own result is ready, for at most `timeout` seconds.
+    """
+    
+    def __init__(self, analyzer: BrightnessAnalyzer, max_batch_size: int = MAX_BATCH_SIZE,
+                 timeout: float = RESULT_TIMEOUT):
+        self.analyzer = analyzer
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self._queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name='brightness-batcher', daemon=True)
+        self._worker.start()
+    
+    def submit(self, brightness: float, metadata: Dict,
+               include_stats: bool = True) -> BrightnessAnalysis:
+        """Queue a brightness value and wait for its analysis"""
+        pending = _PendingSample(brightness, metadata, include_stats)
+        self._queue.put(pending)
+        if not pending.done.wait(self.timeout):
+            raise TimeoutError('Brightness analysis timed out')
+        
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+    
+    def _next_batch(self) -> List[_PendingSample]:
+        """Block for the first pending post, then take the ones already queued"""
+        batch = [self._queue.get()]
+        
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        return batch
+    
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            
+            try:
+                results = self.analyzer.add_brightness_batch(
+                    [pending.brightness for pending in batch],
+                    [pending.metadata for pending in batch],
+                    [pending.include_stats for pending in batch]
+                )
+                for pending, result in zip(batch, results):
+                    pending.result = result
+            except Exception as e:
+                for pending in batch:
+                    pending.error = e
+            
+            for pending in batch:
+                pending.done.set()
+
+
 # Initialize analyzer
 analyzer = BrightnessAnalyzer()
+batcher = BrightnessBatcher(analyzer)
 
 
 @app.route('/api/brightness', methods=['POST'])
@@ -153,32 +541,26 @@ def receive_brightness():
         "frame": 123,
         "device": "spectacles"
     }
+    
+    Pass ?stats=0 to skip the history statistics in the response
+    (analysis.statistics is then null)
     """
     global latest_brightness
     
     try:
         data = request.get_json()
         
-        if 'brightness' not in data:
-            return jsonify({
-                'status': 'error',
-                'message': 'Missing brightness field'
-            }), 400
+        # Checks presence, types and the 0.0-1.0 brightness range
+        validate_brightness_post(data)
         
         brightness = float(data['brightness'])
         
-        # Validate brightness range
-        if not (0.0 <= brightness <= 1.0):
-            return jsonify({
-                'status': 'error',
-                'message': 'Brightness must be between 0.0 and 1.0'
-            }), 400
-        
         # Update latest brightness
         latest_brightness = brightness
         
-        # Analyze brightness
-        analysis = analyzer.add_brightness(brightness, data)
+        # Analyze brightness (batched with concurrent posts)
+        include_stats = request.args.get('stats', '1') != '0'
+        analysis = batcher.submit(brightness, data, include_stats)
         
         return jsonify({
             'status': 'success',
@@ -186,11 +568,23 @@ def receive_brightness():
             'analysis': analysis
         }), 200
     
-    except ValueError as e:
+    except fastjsonschema.JsonSchemaValueException as e:
+        return jsonify({
+            'status': 'error',
+            'message': f'Invalid brightness data: {e.message}'
+        }), 400
+    except BadRequest:
+        # Raised by get_json for unparseable bodies, including NaN and
+        # Infinity, which orjson rejects
         return jsonify({
             'status': 'error',
-            'message': f'Invalid brightness value: {str(e)}'
+            'message': 'Invalid brightness data: body is not valid JSON'
         }), 400
+    except TimeoutError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 503
     except Exception as e:
         return jsonify({
             'status': 'error',
@@ -201,12 +595,15 @@ def receive_brightness():
 @app.route('/api/brightness/latest', methods=['GET'])
 def get_latest_brightness():
     """Get the latest brightness value and analysis"""
-    if analyzer.history:
-        latest = analyzer.history[-1]
-        analysis = analyzer.analyze_brightness(
-            latest['brightness'],
-            latest
-        )
+    # Reuse the analysis computed when the sample was added
+    analysis = analyzer.last_analysis
+    if analysis is not None:
+        # ?stats=0 only trims the POST response; /latest always has statistics
+        if analysis.statistics is None:
+            analysis = BrightnessAnalysis(
+                analysis.brightness, analysis.category, analysis.timestamp,
+                analyzer._calculate_statistics(), analysis.ml_predictions
+            )
         return jsonify(analysis), 200
     else:
         return jsonify({
@@ -220,19 +617,19 @@ def get_brightness_history():
     limit = request.args.get('limit', 100, type=int)
     limit = min(limit, 1000)  # Cap at 1000
     
-    history = analyzer.history[-limit:] if analyzer.history else []
+    history = analyzer.recent_history(limit)
     
     return jsonify({
         'history': history,
         'count': len(history),
-        'total_samples': len(analyzer.history)
+        'total_samples': analyzer.sample_count
     }), 200
 
 
 @app.route('/api/brightness/stats', methods=['GET'])
 def get_brightness_stats():
     """Get statistics about brightness"""
-    stats = analyzer._calculate_statistics()
+    stats = dict(analyzer._calculate_statistics())
     
     if not stats:
         return jsonify({
@@ -316,9 +713,9 @@ def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now_iso(),
         'ml_enabled': ML_ENABLED,
-        'samples_received': len(analyzer.history)
+        'samples_received': analyzer.sample_count
     }), 200
 
 
@@ -337,5 +734,5 @@ if __name__ == '__main__':
     print("\nServer running on http://localhost:5000")
     print("=" * 60)
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=os.environ.get('FLASK_DEBUG') == '1')
 